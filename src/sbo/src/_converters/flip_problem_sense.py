@@ -12,7 +12,6 @@
 
 """Converters to flip problem sense, e.g. maximization to minimization and vice versa."""
 
-import copy
 from typing import List, Optional, Union
 
 import numpy as np
@@ -46,7 +45,7 @@ class _FlipProblemSense(QuadraticProgramConverter):
 
         # flip the problem sense
         if problem.objective.sense != desired_sense:
-            desired_problem = copy.deepcopy(problem)
+            desired_problem = self._copy_problem(problem)
             desired_problem.objective.sense = desired_sense
             desired_problem.objective.constant = (-1) * problem.objective.constant
             desired_problem.objective.linear = (-1) * problem.objective.linear.coefficients
@@ -11,21 +11,27 @@
 # that they have been altered from the originals.
 """The inequality to equality converter."""
 
-import copy
-import math
-from typing import List, Optional, Union
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
+from scipy.sparse import dok_matrix
 
 from .._problems.constraint import Constraint
 from .._problems.exceptions import QiskitOptimizationError
+from .._problems.infinity import INFINITY
 from .._problems.linear_constraint import LinearConstraint
 from .._problems.quadratic_constraint import QuadraticConstraint
 from .._problems.quadratic_objective import QuadraticObjective
 from .._problems.quadratic_program import QuadraticProgram
-from .._problems.variable import Variable
+from .._problems.variable import Variable, VarType
 from .quadratic_program_converter import QuadraticProgramConverter
 
+# Constraint senses looked up once instead of on every constraint
+_EQ = Constraint.Sense.EQ
+_LE = Constraint.Sense.LE
+_GE = Constraint.Sense.GE
+_SENSE_VALUES = (_EQ.value, _LE.value, _GE.value)
+
 
 class InequalityToEquality(QuadraticProgramConverter):
     """Convert inequality constraints into equality constraints by introducing slack variables.
@@ -40,6 +46,7 @@ class InequalityToEquality(QuadraticProgramConverter):
     """
 
     _delimiter = "@"  # users are supposed not to use this character in variable names
+    _MODE_SUFFIX = {"integer": "int", "continuous": "continuous"}
 
     def __init__(self, mode: str = "auto") -> None:
         """
@@ -52,6 +59,9 @@ class InequalityToEquality(QuadraticProgramConverter):
         """
         self._src: Optional[QuadraticProgram] = None
         self._dst: Optional[QuadraticProgram] = None
+        self._interpret_perm: Optional[np.ndarray] = None
+        self._var_lb = np.zeros(0)
+        self._var_ub = np.zeros(0)
         self._mode = mode
 
     def convert(self, problem: QuadraticProgram) -> QuadraticProgram:
@@ -61,200 +71,462 @@ class InequalityToEquality(QuadraticProgramConverter):
             problem: The problem to be solved, that may contain inequality constraints.
 
         Returns:
-            The converted problem, that contain only equality constraints.
+            The converted problem, that contain only equality constraints. If the problem has no
+            inequality constraints, it is returned as is.
 
         Raises:
             QiskitOptimizationError: If a variable type is not supported.
             QiskitOptimizationError: If an unsupported mode is selected.
             QiskitOptimizationError: If an unsupported sense is specified.
         """
-        self._src = copy.deepcopy(problem)
-        self._dst = QuadraticProgram(name=problem.name)
+        # The source problem is only read from, so a deep copy is not needed.
+        self._src = problem
 
         # set a converting mode
         mode = self._mode
         if mode not in ["integer", "continuous", "auto"]:
             raise QiskitOptimizationError(f"Unsupported mode is selected: {mode}")
 
+        # Read the constraint senses into arrays once and split constraints with them.
+        lin_senses = self._senses(problem.linear_constraints)
+        quad_senses = self._senses(problem.quadratic_constraints)
+
+        # just return the problem if it has no inequality constraints
+        if np.all(lin_senses == _EQ.value) and np.all(quad_senses == _EQ.value):
+            self._dst = problem
+            self._interpret_perm = np.arange(problem.get_num_vars())
+            return self._dst
+
+        self._dst = QuadraticProgram(name=problem.name)
+
         # Copy variables
-        for x in self._src.variables:
-            if x.vartype == Variable.Type.BINARY:
-                self._dst.binary_var(name=x.name)
-            elif x.vartype == Variable.Type.INTEGER:
-                self._dst.integer_var(name=x.name, lowerbound=x.lowerbound, upperbound=x.upperbound)
-            elif x.vartype == Variable.Type.CONTINUOUS:
-                self._dst.continuous_var(
-                    name=x.name, lowerbound=x.lowerbound, upperbound=x.upperbound
-                )
-            else:
-                raise QiskitOptimizationError(f"Unsupported variable type {x.vartype}")
+        self._copy_variables()
 
         # Note: QuadraticProgram needs to add all variables before adding any constraints.
+        # Slack variables are collected while scanning the constraints and added in one batch,
+        # right after the original variables: first those of linear, then of quadratic constraints.
+        slack_index = self._src.get_num_vars()
 
         # Add slack variables to linear constraints
-        new_linear_constraints = []
-        for lin_const in self._src.linear_constraints:
-            if lin_const.sense == Constraint.Sense.EQ:
-                new_linear_constraints.append(
-                    (lin_const.linear.coefficients, lin_const.sense, lin_const.rhs, lin_const.name)
-                )
-            elif lin_const.sense in [Constraint.Sense.LE, Constraint.Sense.GE]:
-                new_linear_constraints.append(self._add_slack_var_linear_constraint(lin_const))
-            else:
-                raise QiskitOptimizationError(
-                    f"Internal error: type of sense in {lin_const.name} is not supported: "
-                    f"{lin_const.sense}"
-                )
+        new_linear_constraints, lin_slack_vars = self._stage_constraints(
+            self._src.linear_constraints,
+            lin_senses,
+            self._add_slack_vars_linear_constraints,
+            slack_index,
+        )
 
         # Add slack variables to quadratic constraints
-        new_quadratic_constraints = []
-        for quad_const in self._src.quadratic_constraints:
-            if quad_const.sense == Constraint.Sense.EQ:
-                new_quadratic_constraints.append(
-                    (
-                        quad_const.linear.coefficients,
-                        quad_const.quadratic.coefficients,
-                        quad_const.sense,
-                        quad_const.rhs,
-                        quad_const.name,
-                    )
-                )
-            elif quad_const.sense in [Constraint.Sense.LE, Constraint.Sense.GE]:
-                new_quadratic_constraints.append(
-                    self._add_slack_var_quadratic_constraint(quad_const)
-                )
-            else:
-                raise QiskitOptimizationError(
-                    f"Internal error: type of sense in {quad_const.name} is not supported: "
-                    f"{quad_const.sense}"
-                )
+        new_quadratic_constraints, quad_slack_vars = self._stage_constraints(
+            self._src.quadratic_constraints,
+            quad_senses,
+            self._add_slack_vars_quadratic_constraints,
+            slack_index + len(lin_slack_vars),
+        )
+
+        self._bulk_add_slack_vars(lin_slack_vars + quad_slack_vars)
+
+        # Positions of the original variables in the converted problem, used by `interpret`
+        dst_index = self._dst.variables_index
+        self._interpret_perm = np.fromiter(
+            (dst_index[x.name] for x in self._src.variables),
+            dtype=np.intp,
+            count=self._src.get_num_vars(),
+        )
+
+        # Sparse coefficients copied from the source problem are widened to all variables of the
+        # converted problem, including the slack variables.
+        num_vars = self._dst.get_num_vars()
 
         # Copy the objective function
-        constant = self._src.objective.constant
-        linear = self._src.objective.linear.to_dict(use_name=True)
-        quadratic = self._src.objective.quadratic.to_dict(use_name=True)
-        if self._src.objective.sense == QuadraticObjective.Sense.MINIMIZE:
-            self._dst.minimize(constant, linear, quadratic)
+        self._copy_objective(num_vars)
+
+        # Add linear and quadratic constraints
+        self._add_constraints(new_linear_constraints, new_quadratic_constraints, num_vars)
+
+        return self._dst
+
+    def _copy_variables(self) -> None:
+        """Copy the variables of the source problem to the converted problem in one batch.
+
+        Raises:
+            QiskitOptimizationError: If a variable type is not supported.
+        """
+        names, lowerbounds, upperbounds, vartypes = [], [], [], []
+        for x in self._src.variables:
+            name, lowerbound, upperbound, vartype = x.as_tuple()
+            if vartype == Variable.Type.BINARY:
+                lowerbound, upperbound = 0, 1
+            elif vartype not in (Variable.Type.INTEGER, Variable.Type.CONTINUOUS):
+                raise QiskitOptimizationError(f"Unsupported variable type {vartype}")
+            names.append(name)
+            lowerbounds.append(lowerbound)
+            upperbounds.append(upperbound)
+            vartypes.append(vartype)
+        if names:
+            # pylint: disable=protected-access
+            self._dst._bulk_add_vars(vartypes, names, lowerbounds, upperbounds)
+        # Variable bounds do not change during the conversion; cache them for constraint bounds
+        self._var_lb = np.asarray(lowerbounds, dtype=float)
+        self._var_ub = np.asarray(upperbounds, dtype=float)
+
+    def _stage_constraints(
+        self,
+        constraints: Sequence[Constraint],
+        senses: np.ndarray,
+        add_slack_vars: Callable[
+            [List[Any], np.ndarray, int], Tuple[List[Tuple], List[Tuple[VarType, str, float]]]
+        ],
+        slack_index: int,
+    ) -> Tuple[List[Tuple], List[Tuple[VarType, str, float]]]:
+        """Stage the constraints of one kind for the converted problem, in their original order.
+
+        Args:
+            constraints: The linear or quadratic constraints of the source problem.
+            senses: The sense values of the constraints.
+            add_slack_vars: The batch function that builds the inequality constraints of this kind.
+            slack_index: The index of the first slack variable of the constraints in the
+                converted problem.
+
+        Returns:
+            The arguments to add each constraint to the converted problem, and the
+            ``(vartype, name, upperbound)`` of the slack variables in index order.
+        """
+        staged: List[Any] = [None] * len(constraints)
+        for i in np.flatnonzero(senses == _EQ.value).tolist():
+            constraint = constraints[i]
+            quadratic = (
+                (constraint.quadratic.coefficients,)
+                if isinstance(constraint, QuadraticConstraint)
+                else ()
+            )
+            staged[i] = (
+                constraint.linear.coefficients.copy(),
+                *quadratic,
+                _EQ,
+                constraint.rhs,
+                constraint.name,
+            )
+        ineq_indices = np.flatnonzero(senses != _EQ.value)
+        ineq_staged, slack_vars = add_slack_vars(
+            [constraints[i] for i in ineq_indices.tolist()],
+            senses[ineq_indices] == _LE.value,
+            slack_index,
+        )
+        for i, const_args in zip(ineq_indices.tolist(), ineq_staged):
+            staged[i] = const_args
+        return staged, slack_vars
+
+    def _bulk_add_slack_vars(self, slack_vars: List[Tuple[VarType, str, float]]) -> None:
+        """Add the given ``(vartype, name, upperbound)`` slack variables to the converted problem
+        in one batch."""
+        if slack_vars:
+            vartypes, names, upperbounds = zip(*slack_vars)
+            # pylint: disable=protected-access
+            self._dst._bulk_add_vars(vartypes, names, [0] * len(names), upperbounds)
+
+    def _copy_objective(self, num_vars: int) -> None:
+        """Copy the objective function of the source problem to the converted problem, widening
+        its coefficients to all ``num_vars`` variables of it."""
+        objective = self._src.objective
+        linear = objective.linear.coefficients.copy()
+        linear.resize((1, num_vars))
+        quadratic = objective.quadratic.coefficients.copy()
+        quadratic.resize((num_vars, num_vars))
+        if objective.sense == QuadraticObjective.Sense.MINIMIZE:
+            self._dst.minimize(objective.constant, linear, quadratic)
         else:
-            self._dst.maximize(constant, linear, quadratic)
+            self._dst.maximize(objective.constant, linear, quadratic)
+
+    def _add_constraints(
+        self, linear_constraints: List[Tuple], quadratic_constraints: List[Tuple], num_vars: int
+    ) -> None:
+        """Add the staged constraints to the converted problem, widening their coefficients to
+        all ``num_vars`` variables of it."""
+        linear_shape = (1, num_vars)
+        quadratic_shape = (num_vars, num_vars)
+        add_linear_constraint = self._dst.linear_constraint
+        for lin_const_args in linear_constraints:
+            lin_const_args[0].resize(linear_shape)
+            add_linear_constraint(*lin_const_args)
+
+        add_quadratic_constraint = self._dst.quadratic_constraint
+        for linear, quadratic, *quad_const_args in quadratic_constraints:
+            linear.resize(linear_shape)
+            quadratic = quadratic.copy()
+            quadratic.resize(quadratic_shape)
+            add_quadratic_constraint(linear, quadratic, *quad_const_args)
+
+    def _add_slack_vars_linear_constraints(
+        self, constraints: List[LinearConstraint], is_le: np.ndarray, slack_index: int
+    ) -> Tuple[List[Tuple[dok_matrix, str, float, str]], List[Tuple[VarType, str, float]]]:
+        num = len(constraints)
+        linears = [c.linear.coefficients for c in constraints]
+        owner, keys, values = self._flatten(linears)
+        ind = keys[:, 1]
+        any_float = self._any_float(linears, owner, values)
+        unbounded = self._unbounded(ind[:, None])
+        self._check_slack_errors(
+            constraints, any_float, [("Linear", owner, ind[:, None], unbounded)]
+        )
+
+        lhs_lb, lhs_ub = self._linear_bounds(owner, ind, values, num)
+        new_rhs, new_linear, slack_vars = self._add_slack_vars(
+            constraints, is_le, self._integer_mode(any_float), lhs_lb, lhs_ub, slack_index
+        )
+        return [
+            (lin, "==", rhs, constraint.name)
+            for constraint, lin, rhs in zip(constraints, new_linear, new_rhs)
+        ], slack_vars
+
+    def _add_slack_vars_quadratic_constraints(
+        self, constraints: List[QuadraticConstraint], is_le: np.ndarray, slack_index: int
+    ) -> Tuple[
+        List[Tuple[dok_matrix, dok_matrix, str, float, str]], List[Tuple[VarType, str, float]]
+    ]:
+        num = len(constraints)
+        linears = [c.linear.coefficients for c in constraints]
+        quadratics = [c.quadratic.coefficients for c in constraints]
+        lin_owner, lin_keys, lin_values = self._flatten(linears)
+        quad_owner, quad_keys, quad_values = self._flatten(quadratics)
+        lin_ind = lin_keys[:, 1]
+        any_float = self._any_float(linears, lin_owner, lin_values) | self._any_float(
+            quadratics, quad_owner, quad_values
+        )
+        self._check_slack_errors(
+            constraints,
+            any_float,
+            [
+                ("Linear", lin_owner, lin_ind[:, None], self._unbounded(lin_ind[:, None])),
+                ("Quadratic", quad_owner, quad_keys, self._unbounded(quad_keys)),
+            ],
+        )
+
+        lin_lb, lin_ub = self._linear_bounds(lin_owner, lin_ind, lin_values, num)
+        quad_lb, quad_ub = self._quadratic_bounds(quad_owner, quad_keys, quad_values, num)
+        new_rhs, new_linear, slack_vars = self._add_slack_vars(
+            constraints,
+            is_le,
+            self._integer_mode(any_float),
+            lin_lb + quad_lb,
+            lin_ub + quad_ub,
+            slack_index,
+        )
+        return [
+            (lin, constraint.quadratic.coefficients, "==", rhs, constraint.name)
+            for constraint, lin, rhs in zip(constraints, new_linear, new_rhs)
+        ], slack_vars
 
-        # Add linear constraints
-        for lin_const_args in new_linear_constraints:
-            self._dst.linear_constraint(*lin_const_args)
+    @staticmethod
+    def _senses(constraints: Sequence[Constraint]) -> np.ndarray:
+        """Returns the sense values of the given constraints as an array.
 
-        # Add quadratic constraints
-        for quad_const_args in new_quadratic_constraints:
-            self._dst.quadratic_constraint(*quad_const_args)
+        Raises:
+            QiskitOptimizationError: If an unsupported sense is specified.
+        """
+        senses = np.fromiter(
+            (c.sense.value for c in constraints), dtype=np.int8, count=len(constraints)
+        )
+        unsupported = ~np.isin(senses, _SENSE_VALUES)
+        if unsupported.any():
+            constraint = constraints[int(np.argmax(unsupported))]
+            raise QiskitOptimizationError(
+                f"Internal error: type of sense in {constraint.name} is not supported: "
+                f"{constraint.sense}"
+            )
+        return senses
 
-        return self._dst
+    @staticmethod
+    def _flatten(matrices: List[dok_matrix]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Concatenates the stored entries of a list of sparse matrices into flat arrays, so that
+        all constraints of a batch can be processed with single NumPy passes.
 
-    def _add_slack_var_linear_constraint(self, constraint: LinearConstraint):
-        if self._dst is None:  # to fix mypy
-            raise ValueError("QuadraticProgram not initialized!")
-        linear = constraint.linear
-        sense = constraint.sense
-        name = constraint.name
+        Args:
+            matrices: The sparse coefficients of the constraints.
 
-        any_float = self._any_float(linear.to_array())
-        mode = self._mode
-        if mode == "integer":
-            if any_float:
-                raise QiskitOptimizationError(
-                    f'"{name}" contains float coefficients. '
-                    'We can not use an integer slack variable for "{name}"'
-                )
-        elif mode == "auto":
-            mode = "continuous" if any_float else "integer"
-
-        new_rhs = constraint.rhs
-        if mode == "integer":
-            # If rhs is float number, round up/down to the nearest integer.
-            if sense == Constraint.Sense.LE:
-                new_rhs = math.floor(new_rhs)
-            if sense == Constraint.Sense.GE:
-                new_rhs = math.ceil(new_rhs)
-
-        lin_bounds = linear.bounds
-        lhs_lb = lin_bounds.lowerbound
-        lhs_ub = lin_bounds.upperbound
-
-        var_ub = 0.0
-        sign = 0
-        if sense == Constraint.Sense.LE:
-            var_ub = new_rhs - lhs_lb
-            if var_ub > 0:
-                sign = 1
-        elif sense == Constraint.Sense.GE:
-            var_ub = lhs_ub - new_rhs
-            if var_ub > 0:
-                sign = -1
-
-        new_linear = linear.to_dict(use_name=True)
-        if var_ub > 0:
-            # Add a slack variable.
-            mode_name = {"integer": "int", "continuous": "continuous"}
-            slack_name = f"{name}{self._delimiter}{mode_name[mode]}_slack"
-            if mode == "integer":
-                self._dst.integer_var(name=slack_name, lowerbound=0, upperbound=var_ub)
-            elif mode == "continuous":
-                self._dst.continuous_var(name=slack_name, lowerbound=0, upperbound=var_ub)
-            new_linear[slack_name] = sign
-        return new_linear, "==", new_rhs, name
-
-    def _add_slack_var_quadratic_constraint(self, constraint: QuadraticConstraint):
-        if self._dst is None:  # to fix mypy
-            raise ValueError("QuadraticProgram not initialized!")
-        quadratic = constraint.quadratic
-        linear = constraint.linear
-        sense = constraint.sense
-        name = constraint.name
+        Returns:
+            The position of the matrix each entry belongs to, the ``(row, column)`` keys of the
+            entries as an array of shape ``(nnz, 2)`` and the values of the entries.
+        """
+        counts = np.fromiter((m.nnz for m in matrices), dtype=np.intp, count=len(matrices))
+        total = int(counts.sum())
+        keys = np.fromiter(
+            (k for m in matrices for key in m.keys() for k in key), dtype=np.intp, count=2 * total
+        ).reshape(total, 2)
+        values = np.fromiter((v for m in matrices for v in m.values()), dtype=float, count=total)
+        owner = np.repeat(np.arange(len(matrices)), counts)
+        return owner, keys, values
+
+    def _unbounded(self, ind: np.ndarray) -> np.ndarray:
+        """Returns which of the given variable indices refer to unbounded variables."""
+        return (self._var_lb[ind] == -INFINITY) | (self._var_ub[ind] == INFINITY)
+
+    def _integer_mode(self, any_float: np.ndarray) -> np.ndarray:
+        """Returns whether each constraint gets an integer slack variable (otherwise a continuous
+        one) for the mode of the converter."""
+        if self._mode == "integer":
+            return np.ones_like(any_float)
+        if self._mode == "continuous":
+            return np.zeros_like(any_float)
+        return ~any_float
+
+    def _check_slack_errors(
+        self,
+        constraints: Sequence[Constraint],
+        any_float: np.ndarray,
+        parts: List[Tuple[str, np.ndarray, np.ndarray, np.ndarray]],
+    ) -> None:
+        """Raises the error of the first constraint that cannot get a slack variable. Within a
+        constraint, float coefficients are reported before unbounded variables, and the parts of
+        the constraint are checked in the given order.
 
-        any_float = self._any_float(linear.to_array()) or self._any_float(quadratic.to_array())
-        mode = self._mode
-        if mode == "integer":
-            if any_float:
+        Args:
+            constraints: The inequality constraints.
+            any_float: Whether each constraint contains float coefficients.
+            parts: Tuples ``(expression kind, entry owners, entry variable indices, entry
+                unbounded flags)`` for each part of the constraints.
+
+        Raises:
+            QiskitOptimizationError: If the mode is 'integer' and a constraint contains float
+                coefficients.
+            QiskitOptimizationError: If a constraint contains an unbounded variable.
+        """
+        num = len(constraints)
+        float_error = any_float if self._mode == "integer" else np.zeros(num, dtype=bool)
+        part_errors = [
+            np.bincount(owner, weights=unbounded.any(axis=1), minlength=num) > 0
+            for _, owner, _, unbounded in parts
+        ]
+        failed = np.logical_or.reduce([float_error] + part_errors)
+        if not failed.any():
+            return
+        i = int(np.argmax(failed))
+        if float_error[i]:
+            name = constraints[i].name
+            raise QiskitOptimizationError(
+                f'"{name}" contains float coefficients. '
+                'We can not use an integer slack variable for "{name}"'
+            )
+        for (kind, owner, ind, unbounded), errors in zip(parts, part_errors):
+            if errors[i]:
+                term = np.flatnonzero((owner == i) & unbounded.any(axis=1))[0]
+                var = self._src.variables[ind[term][np.argmax(unbounded[term])]]
                 raise QiskitOptimizationError(
-                    f'"{name}" contains float coefficients. '
-                    'We can not use an integer slack variable for "{name}"'
+                    f"{kind} expression contains an unbounded variable: {var.name}"
                 )
-        elif mode == "auto":
-            mode = "continuous" if any_float else "integer"
-
-        new_rhs = constraint.rhs
-        if mode == "integer":
-            # If rhs is float number, round up/down to the nearest integer.
-            if sense == Constraint.Sense.LE:
-                new_rhs = math.floor(new_rhs)
-            if sense == Constraint.Sense.GE:
-                new_rhs = math.ceil(new_rhs)
-
-        lin_bounds = linear.bounds
-        quad_bounds = quadratic.bounds
-        lhs_lb = lin_bounds.lowerbound + quad_bounds.lowerbound
-        lhs_ub = lin_bounds.upperbound + quad_bounds.upperbound
-
-        var_ub = 0.0
-        sign = 0
-        if sense == Constraint.Sense.LE:
-            var_ub = new_rhs - lhs_lb
-            if var_ub > 0:
-                sign = 1
-        elif sense == Constraint.Sense.GE:
-            var_ub = lhs_ub - new_rhs
+
+    def _linear_bounds(
+        self, owner: np.ndarray, ind: np.ndarray, coeff: np.ndarray, num: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the bounds of a batch of linear expressions from the cached variable bounds.
+        Equivalent to :attr:`LinearExpression.bounds` for each expression.
+        """
+        lst = np.stack([coeff * self._var_lb[ind], coeff * self._var_ub[ind]])
+        return (
+            np.bincount(owner, weights=lst.min(axis=0), minlength=num),
+            np.bincount(owner, weights=lst.max(axis=0), minlength=num),
+        )
+
+    def _quadratic_bounds(
+        self, owner: np.ndarray, keys: np.ndarray, coeff: np.ndarray, num: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the bounds of a batch of quadratic expressions from the cached variable bounds.
+        Equivalent to :attr:`QuadraticExpression.bounds` for each expression.
+        """
+        ind1, ind2 = keys[:, 0], keys[:, 1]
+        x_lb, x_ub = self._var_lb[ind1], self._var_ub[ind1]
+        y_lb, y_ub = self._var_lb[ind2], self._var_ub[ind2]
+        lst = np.stack([x_lb * y_lb, x_lb * y_ub, x_ub * y_lb, x_ub * y_ub])
+        # For a square term, the mixed products are replaced by 0 if the lower bound and the
+        # upper bound have different signs, and by a duplicate of the squared lower bound if not.
+        diag = ind1 == ind2
+        mixed = np.where(x_lb * x_ub <= 0.0, 0.0, x_lb**2)
+        lst[1] = np.where(diag, mixed, lst[1])
+        lst[2] = np.where(diag, mixed, lst[2])
+        lst *= coeff
+        return (
+            np.bincount(owner, weights=lst.min(axis=0), minlength=num),
+            np.bincount(owner, weights=lst.max(axis=0), minlength=num),
+        )
+
+    def _add_slack_vars(
+        self,
+        constraints: Sequence[Constraint],
+        is_le: np.ndarray,
+        integer_mode: np.ndarray,
+        lhs_lb: np.ndarray,
+        lhs_ub: np.ndarray,
+        slack_index: int,
+    ) -> Tuple[List[float], List[dok_matrix], List[Tuple[VarType, str, float]]]:
+        """Build the slack variables of inequality constraints and their new linear parts.
+
+        Args:
+            constraints: The inequality constraints.
+            is_le: Whether each constraint is a '<=' constraint (otherwise it is '>=').
+            integer_mode: Whether each constraint gets an integer slack variable.
+            lhs_lb: The lower bound of the left-hand side of each constraint.
+            lhs_ub: The upper bound of the left-hand side of each constraint.
+            slack_index: The index of the first slack variable of the constraints in the
+                converted problem.
+
+        Returns:
+            The new right-hand sides and the new linear coefficients of the constraints, and the
+            ``(vartype, name, upperbound)`` of their slack variables in index order.
+        """
+        num = len(constraints)
+        rhs = np.fromiter((c.rhs for c in constraints), dtype=float, count=num)
+        new_rhs, var_ubs, signs = self._compute_slacks(is_le, rhs, lhs_lb, lhs_ub, integer_mode)
+
+        slack_vars: List[Tuple[VarType, str, float]] = []
+        integer_suffix = self._delimiter + self._MODE_SUFFIX["integer"] + "_slack"
+        continuous_suffix = self._delimiter + self._MODE_SUFFIX["continuous"] + "_slack"
+        new_linears = []
+        append_linear = new_linears.append
+        for constraint, integer, var_ub, sign in zip(
+            constraints, integer_mode.tolist(), var_ubs.tolist(), signs.tolist()
+        ):
+            new_linear = constraint.linear.coefficients.copy()
             if var_ub > 0:
-                sign = -1
-
-        new_linear = linear.to_dict(use_name=True)
-        if var_ub > 0:
-            # Add a slack variable.
-            mode_name = {"integer": "int", "continuous": "continuous"}
-            slack_name = f"{name}{self._delimiter}{mode_name[mode]}_slack"
-            if mode == "integer":
-                self._dst.integer_var(name=slack_name, lowerbound=0, upperbound=var_ub)
-            elif mode == "continuous":
-                self._dst.continuous_var(name=slack_name, lowerbound=0, upperbound=var_ub)
-            new_linear[slack_name] = sign
-        return new_linear, quadratic.coefficients, "==", new_rhs, name
+                # Add a slack variable.
+                if integer:
+                    slack_name = constraint.name + integer_suffix
+                    slack_vars.append((Variable.Type.INTEGER, slack_name, var_ub))
+                else:
+                    slack_name = constraint.name + continuous_suffix
+                    slack_vars.append((Variable.Type.CONTINUOUS, slack_name, var_ub))
+                new_linear.resize((1, slack_index + 1))
+                new_linear[0, slack_index] = sign
+                slack_index += 1
+            append_linear(new_linear)
+        return new_rhs.tolist(), new_linears, slack_vars
+
+    @staticmethod
+    def _compute_slacks(
+        is_le: np.ndarray,
+        rhs: np.ndarray,
+        lhs_lb: np.ndarray,
+        lhs_ub: np.ndarray,
+        integer_mode: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute the right-hand sides, slack upper bounds and slack signs of a batch of
+        inequality constraints.
+
+        Args:
+            is_le: Whether each constraint is a '<=' constraint (otherwise it is '>=').
+            rhs: The right-hand sides of the constraints.
+            lhs_lb: The lower bounds of the left-hand sides.
+            lhs_ub: The upper bounds of the left-hand sides.
+            integer_mode: Whether each constraint gets an integer slack variable.
+
+        Returns:
+            The new right-hand sides, the upper bounds of the slack variables and the signs of
+            the slack variables. A sign of 0 means that no slack variable is needed.
+        """
+        # If rhs is float number, round up/down to the nearest integer for integer slacks.
+        rounded = np.where(is_le, np.floor(rhs), np.ceil(rhs))
+        new_rhs = np.where(integer_mode, rounded, rhs)
+        var_ub = np.where(is_le, new_rhs - lhs_lb, lhs_ub - new_rhs)
+        sign = np.where(var_ub > 0, np.where(is_le, 1, -1), 0)
+        return new_rhs, var_ub, sign
 
     def interpret(self, x: Union[np.ndarray, List[float]]) -> np.ndarray:
         """Convert a result of a converted problem into that of the original problem.
@@ -265,30 +537,30 @@ class InequalityToEquality(QuadraticProgramConverter):
         Returns:
             The result of the original problem.
         """
-        if self._dst is None or self._src is None:  # to fix mypy
+        if self._interpret_perm is None:  # to fix mypy
             raise ValueError("QuadraticProgram not initialized!")
         # convert back the optimization result into that of the original problem
-        names = [var.name for var in self._dst.variables]
-
-        # interpret slack variables
-        sol = {name: x[i] for i, name in enumerate(names)}
-        new_x = np.zeros(self._src.get_num_vars())
-        for i, var in enumerate(self._src.variables):
-            new_x[i] = sol[var.name]
-        return new_x
+        # by dropping the slack variables
+        return np.asarray(x, dtype=float)[self._interpret_perm]
 
     @staticmethod
-    def _any_float(values: np.ndarray) -> bool:
-        """Check whether the list contains float or not.
-        This method is used to check whether a constraint contain float coefficients or not.
+    def _any_float(matrices: List[dok_matrix], owner: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Check which of the given sparse coefficients contain float values.
+        This method is used to check whether constraints contain float coefficients or not.
 
         Args:
-            values: Coefficients of the constraint
+            matrices: The sparse coefficients of the constraints.
+            owner: The position of the matrix each entry belongs to, as returned by `_flatten`.
+            values: The values of the entries, as returned by `_flatten`.
 
         Returns:
-            bool: If the constraint contains float coefficients, this returns True, else False.
+            Whether each of the matrices contains float coefficients.
         """
-        return any(isinstance(v, float) and not v.is_integer() for v in values)
+        num = len(matrices)
+        # Integer-typed coefficients cannot be fractional, so a batch of them is not scanned.
+        if all(np.issubdtype(m.dtype, np.integer) for m in matrices):
+            return np.zeros(num, dtype=bool)
+        return np.bincount(owner, weights=values != np.floor(values), minlength=num) > 0
 
     @property
     def mode(self) -> str:
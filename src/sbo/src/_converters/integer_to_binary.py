@@ -12,7 +12,6 @@
 
 """The converter to map integer variables in a quadratic program to binary variables."""
 
-import copy
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
@@ -50,6 +49,10 @@ class IntegerToBinary(QuadraticProgramConverter):
         self._dst: Optional[QuadraticProgram] = None
         self._conv: Dict[Variable, List[Tuple[str, int]]] = {}
         # e.g., self._conv = {x: [('x@1', 1), ('x@2', 2)]}
+        self._conv_index: Dict[int, List[Tuple[int, int]]] = {}
+        # same as self._conv, keyed and valued by variable indices, e.g., {0: [(0, 1), (1, 2)]}
+        self._dst_index: List[int] = []
+        # index in the new QP of each variable of the original QP that is not converted
 
     def convert(self, problem: QuadraticProgram) -> QuadraticProgram:
         """Convert an integer problem into a new problem with binary variables.
@@ -65,7 +68,7 @@ class IntegerToBinary(QuadraticProgramConverter):
         """
 
         # Copy original QP as reference.
-        self._src = copy.deepcopy(problem)
+        self._src = self._copy_problem(problem)
 
         if self._src.get_num_integer_vars() > 0:
 
@@ -73,10 +76,16 @@ class IntegerToBinary(QuadraticProgramConverter):
             self._dst = QuadraticProgram(name=problem.name)
 
             # Declare variables
-            for x in self._src.variables:
+            self._conv_index = {}
+            self._dst_index = []
+            for i, x in enumerate(self._src.variables):
+                self._dst_index.append(self._dst.get_num_vars())
                 if x.vartype == Variable.Type.INTEGER:
                     new_vars = self._convert_var(x.name, x.lowerbound, x.upperbound)
                     self._conv[x] = new_vars
+                    self._conv_index[i] = [
+                        (self._dst_index[i] + k, coef) for k, (_, coef) in enumerate(new_vars)
+                    ]
                     for var_name, _ in new_vars:
                         self._dst.binary_var(var_name)
                 else:
@@ -91,7 +100,7 @@ class IntegerToBinary(QuadraticProgramConverter):
 
         else:
             # just copy the problem if no integer variables exist
-            self._dst = copy.deepcopy(problem)
+            self._dst = self._copy_problem(problem)
 
         return self._dst
 
@@ -106,59 +115,62 @@ class IntegerToBinary(QuadraticProgramConverter):
         return [(name + self._delimiter + str(i), coef) for i, coef in enumerate(coeffs)]
 
     def _convert_linear_coefficients_dict(
-        self, coefficients: Dict[str, float]
-    ) -> Tuple[Dict[str, float], float]:
+        self, coefficients: Dict[int, float]
+    ) -> Tuple[Dict[int, float], float]:
         if self._src is None:  # to fix mypy
             raise ValueError("QuadraticProgram not initialized!")
         constant = 0.0
-        linear: Dict[str, float] = {}
-        for name, v in coefficients.items():
-            x = self._src.get_variable(name)
-            if x in self._conv:
-                for y, coeff in self._conv[x]:
-                    linear[y] = v * coeff
-                constant += v * x.lowerbound
+        linear: Dict[int, float] = {}
+        for i, v in coefficients.items():
+            if i in self._conv_index:
+                for k, coeff in self._conv_index[i]:
+                    linear[k] = v * coeff
+                constant += v * self._src.variables[i].lowerbound
             else:
-                linear[x.name] = v
+                linear[self._dst_index[i]] = v
 
         return linear, constant
 
     def _convert_quadratic_coefficients_dict(
-        self, coefficients: Dict[Tuple[str, str], float]
-    ) -> Tuple[Dict[Tuple[str, str], float], Dict[str, float], float]:
+        self, coefficients: Dict[Tuple[int, int], float]
+    ) -> Tuple[Dict[Tuple[int, int], float], Dict[int, float], float]:
         if self._src is None:  # to fix mypy
             raise ValueError("QuadraticProgram not initialized!")
         constant = 0.0
-        linear: Dict[str, float] = {}
+        linear: Dict[int, float] = {}
         quadratic = {}
-        for (name_i, name_j), v in coefficients.items():
-            x = self._src.get_variable(name_i)
-            y = self._src.get_variable(name_j)
-
-            if x in self._conv and y not in self._conv:
-                for z_x, coeff_x in self._conv[x]:
-                    quadratic[z_x, y.name] = v * coeff_x
-                linear[y.name] = linear.get(y.name, 0.0) + v * x.lowerbound
-
-            elif x not in self._conv and y in self._conv:
-                for z_y, coeff_y in self._conv[y]:
-                    quadratic[x.name, z_y] = v * coeff_y
-                linear[x.name] = linear.get(x.name, 0.0) + v * y.lowerbound
-
-            elif x in self._conv and y in self._conv:
-                for z_x, coeff_x in self._conv[x]:
-                    for z_y, coeff_y in self._conv[y]:
+        for (i, j), v in coefficients.items():
+            x_conv = self._conv_index.get(i)
+            y_conv = self._conv_index.get(j)
+
+            if x_conv is not None and y_conv is None:
+                y = self._dst_index[j]
+                for z_x, coeff_x in x_conv:
+                    quadratic[z_x, y] = v * coeff_x
+                linear[y] = linear.get(y, 0.0) + v * self._src.variables[i].lowerbound
+
+            elif x_conv is None and y_conv is not None:
+                x = self._dst_index[i]
+                for z_y, coeff_y in y_conv:
+                    quadratic[x, z_y] = v * coeff_y
+                linear[x] = linear.get(x, 0.0) + v * self._src.variables[j].lowerbound
+
+            elif x_conv is not None and y_conv is not None:
+                x_lb = self._src.variables[i].lowerbound
+                y_lb = self._src.variables[j].lowerbound
+                for z_x, coeff_x in x_conv:
+                    for z_y, coeff_y in y_conv:
                         quadratic[z_x, z_y] = v * coeff_x * coeff_y
 
-                for z_x, coeff_x in self._conv[x]:
-                    linear[z_x] = linear.get(z_x, 0.0) + v * coeff_x * y.lowerbound
-                for z_y, coeff_y in self._conv[y]:
-                    linear[z_y] = linear.get(z_y, 0.0) + v * coeff_y * x.lowerbound
+                for z_x, coeff_x in x_conv:
+                    linear[z_x] = linear.get(z_x, 0.0) + v * coeff_x * y_lb
+                for z_y, coeff_y in y_conv:
+                    linear[z_y] = linear.get(z_y, 0.0) + v * coeff_y * x_lb
 
-                constant += v * x.lowerbound * y.lowerbound
+                constant += v * x_lb * y_lb
 
             else:
-                quadratic[x.name, y.name] = v
+                quadratic[self._dst_index[i], self._dst_index[j]] = v
 
         return quadratic, linear, constant
 
@@ -166,15 +178,13 @@ class IntegerToBinary(QuadraticProgramConverter):
 
         # set objective
         linear, linear_constant = self._convert_linear_coefficients_dict(
-            self._src.objective.linear.to_dict(use_name=True)
+            self._src.objective.linear.to_dict()
         )
         (
             quadratic,
             q_linear,
             q_constant,
-        ) = self._convert_quadratic_coefficients_dict(
-            self._src.objective.quadratic.to_dict(use_name=True)
-        )
+        ) = self._convert_quadratic_coefficients_dict(self._src.objective.quadratic.to_dict())
 
         constant = self._src.objective.constant + linear_constant + q_constant
         for i, v in q_linear.items():
@@ -187,9 +197,7 @@ class IntegerToBinary(QuadraticProgramConverter):
 
         # set linear constraints
         for constraint in self._src.linear_constraints:
-            linear, constant = self._convert_linear_coefficients_dict(
-                constraint.linear.to_dict(use_name=True)
-            )
+            linear, constant = self._convert_linear_coefficients_dict(constraint.linear.to_dict())
             self._dst.linear_constraint(
                 linear, constraint.sense, constraint.rhs - constant, constraint.name
             )
@@ -197,10 +205,10 @@ class IntegerToBinary(QuadraticProgramConverter):
         # set quadratic constraints
         for constraint in self._src.quadratic_constraints:
             linear, linear_constant = self._convert_linear_coefficients_dict(
-                constraint.linear.to_dict(use_name=True)
+                constraint.linear.to_dict()
             )
             quadratic, q_linear, q_constant = self._convert_quadratic_coefficients_dict(
-                constraint.quadratic.to_dict(use_name=True)
+                constraint.quadratic.to_dict()
             )
 
             constant = linear_constant + q_constant
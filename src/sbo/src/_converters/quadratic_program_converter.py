@@ -12,14 +12,36 @@
 
 """An abstract class for optimization algorithms in Qiskit optimization module."""
 
+import io
+import pickle
 from abc import ABC, abstractmethod
-from typing import List, Union
+from typing import Any, List, Union
 
 import numpy as np
+from scipy.sparse import coo_matrix, dok_matrix
 
 from .._problems.quadratic_program import QuadraticProgram
 
 
+def _dok_from_coo(coefficients: coo_matrix) -> dok_matrix:
+    return coefficients.todok()
+
+
+class _ProblemPickler(pickle.Pickler):
+    """Pickles dok_matrix coefficients as COO arrays.
+
+    dok_matrix is pickled entry by entry through its indexing. COO arrays are pickled as a few
+    NumPy buffers instead, which protocol 5 passes out of band. This only applies to the copies
+    made by :meth:`QuadraticProgramConverter._copy_problem`; pickles of problems written elsewhere
+    are unchanged.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, dok_matrix):
+            return _dok_from_coo, (obj.tocoo(),)
+        return NotImplemented
+
+
 class QuadraticProgramConverter(ABC):
     """
     An abstract class for converters of quadratic programs in Qiskit optimization module.
@@ -36,3 +58,16 @@ class QuadraticProgramConverter(ABC):
     def interpret(self, x: Union[np.ndarray, List[float]]) -> np.ndarray:
         """Interpret a result into another form using the information of conversion"""
         raise NotImplementedError
+
+    @staticmethod
+    def _copy_problem(problem: QuadraticProgram) -> QuadraticProgram:
+        """Returns a deep copy of a QuadraticProgram.
+
+        The copy goes through pickle protocol 5 with out-of-band buffers, so the coefficient
+        arrays are handed over as buffers instead of being visited object by object as
+        ``copy.deepcopy`` does.
+        """
+        buffers: List[pickle.PickleBuffer] = []
+        data = io.BytesIO()
+        _ProblemPickler(data, protocol=5, buffer_callback=buffers.append).dump(problem)
+        return pickle.loads(data.getbuffer(), buffers=buffers)
@@ -240,6 +240,46 @@ class QuadraticProgram:
             variables.append(variable)
         return names, variables
 
+    def _bulk_add_vars(
+        self,
+        vartypes: Sequence[VarType],
+        names: Sequence[str],
+        lowerbounds: Sequence[Union[float, int]],
+        upperbounds: Sequence[Union[float, int]],
+    ) -> List[Variable]:
+        """
+        Appends variables with explicitly given names to the variable list and updates the
+        variable index once for the whole batch. This is meant for converters that rebuild a
+        problem variable by variable and already know all names in advance.
+
+        Args:
+            vartypes: The types of the variables.
+            names: The names of the variables.
+            lowerbounds: The lower bounds of the variables.
+            upperbounds: The upper bounds of the variables.
+
+        Returns:
+            The list of added variable instances.
+
+        Raises:
+            QiskitOptimizationError: if a variable name is already taken.
+        """
+        start = self.get_num_vars()
+        new_index = dict(zip(names, range(start, start + len(names))))
+        if len(new_index) < len(names) or not self._variables_index.keys().isdisjoint(new_index):
+            seen = set(self._variables_index)
+            for name in names:
+                if name in seen:
+                    raise QiskitOptimizationError(f"Variable name already exists: {name}")
+                seen.add(name)
+        variables = []
+        for vartype, name, lowerbound, upperbound in zip(vartypes, names, lowerbounds, upperbounds):
+            self._check_name(name, "Variable")
+            variables.append(Variable(self, name, lowerbound, upperbound, vartype))
+        self._variables.extend(variables)
+        self._variables_index.update(new_index)
+        return variables
+
     # pylint: disable=too-many-positional-arguments
     def _var_dict(
         self,